@@ -7,11 +7,96 @@ and comment insights.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
-from typing import Iterable, List, Sequence
+from typing import Callable, Dict, Final, Iterable, List, Sequence
 
+# Section names, interned so lookups in the template tables below hit the
+# identity fast path when called with ``section_order`` entries.
+_INTRO: Final = sys.intern("서론")
+_PROBLEM: Final = sys.intern("문제 제기")
+_INFO: Final = sys.intern("정보 제공")
+_WRAP_UP: Final = sys.intern("정리")
 
-@dataclass
+# Fallback phrases used when keywords or comment insights are missing.
+_DEFAULT_HIGHLIGHTS: Final = "주목 받은 의견"
+_DEFAULT_PAIN_POINTS: Final = "해결이 필요한 문제"
+_DEFAULT_WISHES: Final = "독자가 바라는 방향"
+_DEFAULT_TONE_HINT: Final = "독자 의견"
+_DEFAULT_TONE: Final = "긍정적"
+_DEFAULT_KEYWORD_TEXT: Final = "핵심 키워드"
+_DEFAULT_SEO_HINT: Final = "핵심 포인트"
+
+# Section templates, written as plain functions so each render is a compiled
+# f-string. Subheadings take (title, tone_hint); paragraphs take
+# (keyword_text, highlights, pain_points, wishes, tone).
+def _intro_subheading(title: str, tone_hint: str) -> str:
+    return f"{title}를 살펴보기 위한 첫걸음"
+
+
+def _problem_subheading(title: str, tone_hint: str) -> str:
+    return f"{tone_hint} 속에서 드러난 고민"
+
+
+def _info_subheading(title: str, tone_hint: str) -> str:
+    return "핵심 정보와 적용 팁"
+
+
+def _closing_subheading(title: str, tone_hint: str) -> str:
+    return "정리하며 살펴볼 핵심 포인트"
+
+
+def _intro_paragraph(
+    keyword_text: str, highlights: str, pain_points: str, wishes: str, tone: str
+) -> str:
+    return (
+        f"읽기 쉬운 흐름으로 시작합니다. {keyword_text}를 자연스럽게 녹여 "
+        "주제를 소개하고, 독자가 궁금해할 질문을 던집니다."
+    )
+
+
+def _problem_paragraph(
+    keyword_text: str, highlights: str, pain_points: str, wishes: str, tone: str
+) -> str:
+    return (
+        f"댓글에서 특히 언급된 '{pain_points}'를 토대로 문제를 정리합니다. "
+        f"{keyword_text}를 과도하지 않게 배치해 공감대를 형성합니다."
+    )
+
+
+def _info_paragraph(
+    keyword_text: str, highlights: str, pain_points: str, wishes: str, tone: str
+) -> str:
+    return (
+        f"실제 독자가 강조한 '{highlights}'와 바라는 '{wishes}'를 중심으로 "
+        f"정보와 사례를 제시합니다. {keyword_text}는 활용 팁과 함께 배치해 "
+        "검색 가독성을 높입니다."
+    )
+
+
+def _closing_paragraph(
+    keyword_text: str, highlights: str, pain_points: str, wishes: str, tone: str
+) -> str:
+    return (
+        f"앞서 다룬 내용을 간결하게 요약하며 {keyword_text}를 다시 한 번 짚습니다. "
+        f"독자가 바로 적용할 수 있는 다음 행동을 안내하고 톤을 '{tone}'으로 유지합니다."
+    )
+
+
+# Templates keyed by section name. Sections without an entry fall back to the
+# closing template so custom ``section_order`` values still render.
+_SUBHEADING_TEMPLATES: Final[Dict[str, Callable[[str, str], str]]] = {
+    _INTRO: _intro_subheading,
+    _PROBLEM: _problem_subheading,
+    _INFO: _info_subheading,
+}
+_PARAGRAPH_TEMPLATES: Final[Dict[str, Callable[[str, str, str, str, str], str]]] = {
+    _INTRO: _intro_paragraph,
+    _PROBLEM: _problem_paragraph,
+    _INFO: _info_paragraph,
+}
+
+@dataclass(slots=True)
 class CommentSummary:
     """Aggregated information distilled from user comments.
 
@@ -38,10 +123,10 @@ class BlogPostGenerator:
     """
 
     section_order: Sequence[str] = (
-        "서론",
-        "문제 제기",
-        "정보 제공",
-        "정리",
+        _INTRO,
+        _PROBLEM,
+        _INFO,
+        _WRAP_UP,
     )
 
     def __init__(self, *, keywords_per_section: int = 2) -> None:
@@ -68,23 +153,28 @@ class BlogPostGenerator:
         """
 
         keywords = [kw.strip() for kw in keywords if kw.strip()]
+        # Comment-derived phrases are shared by every section; compute them once.
+        tone_hint = comment_summary.tone or _DEFAULT_TONE_HINT
+        highlights = ", ".join(comment_summary.highlights[:2]) or _DEFAULT_HIGHLIGHTS
+        pain_points = ", ".join(comment_summary.pain_points[:2]) or _DEFAULT_PAIN_POINTS
+        wishes = ", ".join(comment_summary.wishes[:2]) or _DEFAULT_WISHES
+        tone = comment_summary.tone or _DEFAULT_TONE
+        fallback_keywords = keywords[: self.keywords_per_section]
         outline = self._build_outline(title, keywords)
         sections = []
 
         for idx, section_name in enumerate(self.section_order):
-            assigned_keywords = self._keywords_for_section(keywords, idx)
-            section_body = self._build_section(
-                section_name=section_name,
-                title=title,
-                keywords=assigned_keywords,
-                comment_summary=comment_summary,
+            assigned_keywords = self._keywords_for_section(keywords, idx, fallback_keywords)
+            subheading = self._build_subheading(section_name, title, tone_hint)
+            paragraph = self._build_paragraph(
+                section_name, assigned_keywords, highlights, pain_points, wishes, tone
             )
-            sections.append(section_body)
+            sections.append(self._build_section(section_name, subheading, paragraph))
 
         return "\n\n".join(outline + sections)
 
     def _build_outline(self, title: str, keywords: Sequence[str]) -> List[str]:
-        seo_hint = ", ".join(keywords[:3]) if keywords else "핵심 포인트"
+        seo_hint = ", ".join(keywords[:3]) if keywords else _DEFAULT_SEO_HINT
         outline_lines = [
             f"# {title}",
             f"- 주제 키워드: {seo_hint}",
@@ -92,67 +182,36 @@ class BlogPostGenerator:
         ]
         return outline_lines
 
-    def _build_section(
+    def _build_section(self, section_name: str, subheading: str, paragraph: str) -> str:
+        return f"## {section_name}\n### {subheading}\n{paragraph}"
+
+    def _build_subheading(self, section_name: str, title: str, tone_hint: str) -> str:
+        render = _SUBHEADING_TEMPLATES.get(section_name, _closing_subheading)
+        return render(title, tone_hint)
+
+    def _build_paragraph(
         self,
-        *,
         section_name: str,
-        title: str,
         keywords: Sequence[str],
-        comment_summary: CommentSummary,
-    ) -> str:
-        heading = f"## {section_name}"
-        subheading = self._build_subheading(section_name, title, comment_summary)
-        paragraph = self._build_paragraph(section_name, keywords, comment_summary)
-        return "\n".join([heading, f"### {subheading}", paragraph])
-
-    def _build_subheading(self, section_name: str, title: str, comment_summary: CommentSummary) -> str:
-        tone_hint = comment_summary.tone or "독자 의견"
-        if section_name == "서론":
-            return f"{title}를 살펴보기 위한 첫걸음"
-        if section_name == "문제 제기":
-            return f"{tone_hint} 속에서 드러난 고민"
-        if section_name == "정보 제공":
-            return "핵심 정보와 적용 팁"
-        return "정리하며 살펴볼 핵심 포인트"
-
-    def _build_paragraph(
-        self, section_name: str, keywords: Sequence[str], comment_summary: CommentSummary
+        highlights: str,
+        pain_points: str,
+        wishes: str,
+        tone: str,
     ) -> str:
-        keyword_text = self._scatter_keywords(keywords)
-        highlights = ", ".join(comment_summary.highlights[:2]) or "주목 받은 의견"
-        pain_points = ", ".join(comment_summary.pain_points[:2]) or "해결이 필요한 문제"
-        wishes = ", ".join(comment_summary.wishes[:2]) or "독자가 바라는 방향"
-
-        if section_name == "서론":
-            return (
-                f"읽기 쉬운 흐름으로 시작합니다. {keyword_text}를 자연스럽게 녹여 "
-                "주제를 소개하고, 독자가 궁금해할 질문을 던집니다."
-            )
-        if section_name == "문제 제기":
-            return (
-                f"댓글에서 특히 언급된 '{pain_points}'를 토대로 문제를 정리합니다. "
-                f"{keyword_text}를 과도하지 않게 배치해 공감대를 형성합니다."
-            )
-        if section_name == "정보 제공":
-            return (
-                f"실제 독자가 강조한 '{highlights}'와 바라는 '{wishes}'를 중심으로 "
-                f"정보와 사례를 제시합니다. {keyword_text}는 활용 팁과 함께 배치해 "
-                "검색 가독성을 높입니다."
-            )
-        return (
-            f"앞서 다룬 내용을 간결하게 요약하며 {keyword_text}를 다시 한 번 짚습니다. "
-            f"독자가 바로 적용할 수 있는 다음 행동을 안내하고 톤을 '{comment_summary.tone or '긍정적'}'으로 유지합니다."
-        )
+        render = _PARAGRAPH_TEMPLATES.get(section_name, _closing_paragraph)
+        return render(self._scatter_keywords(keywords), highlights, pain_points, wishes, tone)
 
     def _scatter_keywords(self, keywords: Sequence[str]) -> str:
         if not keywords:
-            return "핵심 키워드"
+            return _DEFAULT_KEYWORD_TEXT
         return "와 ".join(keywords[: self.keywords_per_section])
 
-    def _keywords_for_section(self, keywords: Sequence[str], section_index: int) -> List[str]:
+    def _keywords_for_section(
+        self, keywords: Sequence[str], section_index: int, fallback: Sequence[str]
+    ) -> Sequence[str]:
         start = section_index * self.keywords_per_section
         end = start + self.keywords_per_section
-        return list(keywords[start:end]) or list(keywords[: self.keywords_per_section])
+        return keywords[start:end] or fallback
 
 
 __all__ = ["BlogPostGenerator", "CommentSummary"]
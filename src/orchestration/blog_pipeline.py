@@ -15,7 +15,10 @@ This file is the "control tower" that stitches together the modules created earl
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
@@ -27,8 +30,15 @@ from analysis.comment_analyzer import CommentAnalyzer
 from generation.title_generator import TitleGenerator
 from generation.blog_post_generator import BlogPostGenerator, CommentSummary
 
+# A token is a run of characters that are neither whitespace nor the
+# punctuation treated as separators by the simple keyword tokenizer.
+_TOKEN_RE = re.compile(r"[^\s,.:;!?()\[\]{}\"']+")
 
-@dataclass
+# Shared worker pool used to overlap comment analysis with HTML ingestion.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="blog-pipeline")
+
+
+@dataclass(slots=True)
 class PipelineInput:
     # One of url or html must be provided
     url: Optional[str] = None
@@ -41,7 +51,7 @@ class PipelineInput:
     comments: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineOutput:
     parsed: Dict[str, Any]
     comment_summary: Dict[str, Any]
@@ -57,27 +67,46 @@ class BlogPipeline:
     def __init__(self) -> None:
         self.settings = get_settings()
 
-        # Components
-        self.comment_analyzer = CommentAnalyzer()
-        self.title_generator = TitleGenerator()
-        self.blog_generator = BlogPostGenerator()
+    # Components are built on first use, so runs that never need one
+    # (e.g. no comments to analyze) don't pay for constructing it.
+    @functools.cached_property
+    def comment_analyzer(self) -> CommentAnalyzer:
+        return CommentAnalyzer()
+
+    @functools.cached_property
+    def title_generator(self) -> TitleGenerator:
+        return TitleGenerator()
+
+    @functools.cached_property
+    def blog_generator(self) -> BlogPostGenerator:
+        return BlogPostGenerator()
 
     def run(self, inp: PipelineInput) -> PipelineOutput:
         if not inp.url and not inp.html:
             raise ValueError("Either 'url' or 'html' must be provided.")
 
-        # 1) Ingest HTML
-        source = inp.url if inp.url else inp.html
-        parsed_page: ParsedPage = parse_html(source)
-
-        # 2) Gather comments (optional)
+        # 1) Gather comments (optional)
         #    For now: use inp.comments if provided.
         comments: List[str] = inp.comments or []
 
-        # 3) Analyze comments -> CommentSummary
+        # 2) Analyze comments -> CommentSummary
         #    CommentAnalyzer is expected to return a CommentSummary-like dict or object.
         #    We normalize to CommentSummary for BlogPostGenerator.
-        comment_summary = self._analyze_comments(comments)
+        #    Analysis doesn't depend on the page, so it runs on a worker thread
+        #    while the HTML is fetched/parsed below.
+        analyze_future: Optional[Future[CommentSummary]] = None
+        if comments:
+            analyze_future = _EXECUTOR.submit(self._analyze_comments, comments)
+
+        # 3) Ingest HTML
+        source = inp.url if inp.url else inp.html
+        parsed_page: ParsedPage = parse_html(source)
+
+        comment_summary = (
+            analyze_future.result()
+            if analyze_future is not None
+            else self._analyze_comments(comments)
+        )
 
         # 4) Generate title (use page title + body + insights)
         title = self._generate_title(parsed_page, comment_summary)
@@ -167,25 +196,16 @@ class BlogPipeline:
             seeds.extend(self._tokenize_ko_simple(title))
         if parsed_page.meta_description:
             seeds.extend(self._tokenize_ko_simple(parsed_page.meta_description))
-        # De-duplicate while preserving order
-        seen = set()
-        out: List[str] = []
-        for s in seeds:
-            s = s.strip()
-            if not s or len(s) < 2:
-                continue
-            if s in seen:
-                continue
-            seen.add(s)
-            out.append(s)
-        return out[:12]
-
-    def _tokenize_ko_simple(self, text: str) -> List[str]:
+        # De-duplicate while preserving order (tokens arrive already stripped)
+        return list(dict.fromkeys(s for s in seeds if len(s) >= 2))[:12]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _tokenize_ko_simple(text: str) -> Tuple[str, ...]:
         # Minimal tokenizer: split by spaces and punctuation-ish.
         # Keep it simple to avoid extra dependencies.
-        for ch in [",", ".", ":", ";", "!", "?", "(", ")", "[", "]", "{", "}", "\"", "'"]:
-            text = text.replace(ch, " ")
-        return [t for t in text.split() if t]
+        # Cached per input string; returns a tuple so callers can't mutate it.
+        return tuple(_TOKEN_RE.findall(text))
 
 
 def _parse_comments_arg(raw: Optional[str]) -> Optional[List[str]]:
@@ -200,14 +220,14 @@ def _parse_comments_arg(raw: Optional[str]) -> Optional[List[str]]:
     if not raw:
         return None
 
-    # Try JSON
-    if raw.startswith("["):
+    # Try JSON (only when the input is bracketed like an array)
+    if raw[:1] == "[" and raw[-1:] == "]":
         try:
             data = json.loads(raw)
-            if isinstance(data, list):
-                return [str(x) for x in data]
-        except Exception:
-            pass
+        except (ValueError, RecursionError):
+            data = None
+        if isinstance(data, list):
+            return [str(x) for x in data]
 
     # Fallback: newline split
     return [line.strip() for line in raw.splitlines() if line.strip()]